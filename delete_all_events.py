@@ -1,8 +1,10 @@
 import argparse
+import concurrent.futures
 import datetime
+import functools
 import logging
 import sys
-from typing import List, Tuple, Any, Optional
+from typing import Dict, List, Tuple, Any, Optional
 from zoneinfo import ZoneInfo
 from google.oauth2 import service_account
 from googleapiclient.discovery import build
@@ -10,10 +12,23 @@ from googleapiclient.errors import HttpError # Import HttpError for better error
 
 # Constants (Keep relevant ones)
 TIMEZONE: str = 'America/Los_Angeles'
+_TZ: ZoneInfo = ZoneInfo(TIMEZONE)
 LOCATION_TO_CALENDAR = {
     "Mervin": "c1b24574cbbcfe3d62b323de33ebc50956edf9212737a88f9423c661c5e37204@group.calendar.google.com",
     "Bay": "8320fe0a847ce736584415a3777a3d4eb69e650d459ae9329fa1aaed42cf36d1@group.calendar.google.com"
 }
+BATCH_SIZE: int = 50 # Calendar API limit for requests per batch HTTP call
+
+@functools.lru_cache(maxsize=4)
+def _load_credentials(credentials_path: str) -> service_account.Credentials:
+    """
+    Loads the service account credentials from credentials_path once per path.
+
+    Sharing one Credentials object lets every service built from it reuse the same
+    access token instead of each fetching its own.
+    """
+    scopes = ['https://www.googleapis.com/auth/calendar.events']
+    return service_account.Credentials.from_service_account_file(credentials_path, scopes=scopes)
 
 def authenticate_google(credentials_path: str) -> Any:
     """
@@ -28,17 +43,17 @@ def authenticate_google(credentials_path: str) -> Any:
     Raises:
         Exception: If credential loading or service creation fails.
     """
-    scopes = ['https://www.googleapis.com/auth/calendar.events']
     try:
-        credentials = service_account.Credentials.from_service_account_file(credentials_path, scopes=scopes)
-        service = build('calendar', 'v3', credentials=credentials)
+        credentials = _load_credentials(credentials_path)
+        # Use the discovery document bundled with google-api-python-client instead of fetching it over HTTP
+        service = build('calendar', 'v3', credentials=credentials, static_discovery=True, cache_discovery=False)
         logging.info("Successfully authenticated with Google Calendar API.")
         return service
     except FileNotFoundError:
-        logging.error(f"Credentials file not found at: {credentials_path}")
+        logging.error("Credentials file not found at: %s", credentials_path)
         sys.exit(1)
     except Exception as e:
-        logging.error(f"Failed to authenticate Google service: {e}")
+        logging.error("Failed to authenticate Google service: %s", e)
         sys.exit(1)
 
 
@@ -61,25 +76,26 @@ def fetch_calendar_events(service: Any, calendar_id: str, time_min_iso: str, tim
     page_token: Optional[str] = None
     try:
         # Convert local ISO time strings to timezone-aware RFC3339 strings for the API
-        tz = ZoneInfo(TIMEZONE)
         # Use T00:00:00 for date-only comparison if time part isn't crucial, or keep time part if needed
-        time_min_dt = datetime.datetime.fromisoformat(time_min_iso).replace(tzinfo=tz)
-        time_max_dt = datetime.datetime.fromisoformat(time_max_iso).replace(tzinfo=tz)
+        time_min_dt = datetime.datetime.fromisoformat(time_min_iso).replace(tzinfo=_TZ)
+        time_max_dt = datetime.datetime.fromisoformat(time_max_iso).replace(tzinfo=_TZ)
         time_min_rfc3339 = time_min_dt.isoformat()
         time_max_rfc3339 = time_max_dt.isoformat()
 
-        logging.debug(f"Fetching events for calendar {calendar_id} between {time_min_rfc3339} and {time_max_rfc3339}")
+        logging.debug("Fetching events for calendar %s between %s and %s", calendar_id, time_min_rfc3339, time_max_rfc3339)
 
+        events_api = service.events()
         while True:
-            response = service.events().list(
+            response = events_api.list(
                 calendarId=calendar_id,
                 timeMin=time_min_rfc3339,
                 timeMax=time_max_rfc3339,
                 singleEvents=True, # Important for recurring events
                 orderBy='startTime',
                 pageToken=page_token,
-                # Consider adding maxResults if needed, default is 250
-                # maxResults=2500 # Max allowed is 2500
+                maxResults=2500, # Max allowed page size, default is 250
+                fields="items(id,summary,start(dateTime,date),end(dateTime,date)),nextPageToken", # Only the fields used below
+                q="Court " # Server-side pre-filter, refined by the summary check below
             ).execute()
 
             for event in response.get('items', []):
@@ -98,19 +114,47 @@ def fetch_calendar_events(service: Any, calendar_id: str, time_min_iso: str, tim
             page_token = response.get("nextPageToken")
             if not page_token:
                 break
-        logging.info(f"Found {len(events)} events matching 'Court *' summary in calendar {calendar_id} within the specified range.")
+        logging.info("Found %s events matching 'Court *' summary in calendar %s within the specified range.", len(events), calendar_id)
 
     except HttpError as e:
-        logging.error(f"Error fetching events from calendar {calendar_id}: {e}")
+        logging.error("Error fetching events from calendar %s: %s", calendar_id, e)
         # Decide if you want to stop or continue with other calendars
         # For now, return empty list for this calendar
     except Exception as e:
-        logging.error(f"An unexpected error occurred while fetching events for calendar {calendar_id}: {e}")
+        logging.error("An unexpected error occurred while fetching events for calendar %s: %s", calendar_id, e)
         # Return empty list
 
     return events
 
 
+def fetch_all_calendar_events(credentials_path: str, location_to_calendar: Dict[str, str], time_min_iso: str, time_max_iso: str) -> Dict[str, List[dict]]:
+    """
+    Fetches existing calendar events for several calendars concurrently.
+
+    Each calendar is listed in its own worker thread. The underlying httplib2 transport
+    is not thread-safe, so every worker builds its own Calendar API service object.
+
+    Args:
+        credentials_path (str): The path to the service account JSON credentials file.
+        location_to_calendar (Dict[str, str]): Mapping of location name to calendar ID.
+        time_min_iso (str): The lower bound (inclusive) of event start times (ISO format without timezone).
+        time_max_iso (str): The upper bound (exclusive) of event end times (ISO format without timezone).
+
+    Returns:
+        Dict[str, List[dict]]: The events returned by fetch_calendar_events, keyed by location.
+    """
+    def _fetch(calendar_id: str) -> List[dict]:
+        service = authenticate_google(credentials_path)
+        return fetch_calendar_events(service, calendar_id, time_min_iso, time_max_iso)
+
+    results: Dict[str, List[dict]] = {}
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max(len(location_to_calendar), 1)) as executor:
+        futures = {executor.submit(_fetch, calendar_id): location for location, calendar_id in location_to_calendar.items()}
+        for future in concurrent.futures.as_completed(futures):
+            results[futures[future]] = future.result()
+    return results
+
+
 def delete_google_event(service: Any, calendar_id: str, event_id: str, dry_run: bool) -> None:
     """
     Deletes a Google Calendar event.
@@ -128,24 +172,73 @@ def delete_google_event(service: Any, calendar_id: str, event_id: str, dry_run:
         - For other errors, logs the error but continues execution.
     """
     if dry_run:
-        logging.info(f"[Dry-run] Would delete event: {event_id} from calendar {calendar_id}")
+        logging.info("[Dry-run] Would delete event: %s from calendar %s", event_id, calendar_id)
         return None
     try:
         service.events().delete(calendarId=calendar_id, eventId=event_id).execute()
-        logging.info(f"Deleted event: {event_id} from calendar {calendar_id}")
+        logging.info("Deleted event: %s from calendar %s", event_id, calendar_id)
     except HttpError as e:
         # 410 Gone (already deleted) or 404 Not Found are common and can be treated as warnings
         if e.resp.status in [404, 410]:
-            logging.warning(f"Event {event_id} already deleted or not found (Status: {e.resp.status}): {e}")
+            logging.warning("Event %s already deleted or not found (Status: %s): %s", event_id, e.resp.status, e)
         else:
-            logging.error(f"Error deleting event {event_id} from calendar {calendar_id}: {e}")
+            logging.error("Error deleting event %s from calendar %s: %s", event_id, calendar_id, e)
             # Decide if you want to exit: sys.exit(1) or continue
     except Exception as e:
-        logging.error(f"An unexpected error occurred while deleting event {event_id}: {e}")
+        logging.error("An unexpected error occurred while deleting event %s: %s", event_id, e)
         # Decide if you want to exit: sys.exit(1) or continue
     return None
 
 
+def delete_google_events_batch(service: Any, calendar_id: str, event_ids: List[str], dry_run: bool) -> int:
+    """
+    Deletes Google Calendar events using batch HTTP requests.
+
+    Event deletions are grouped into batches of up to BATCH_SIZE requests, so each
+    batch costs a single HTTP round-trip instead of one per event.
+
+    Args:
+        service: Authorized Google Calendar API service object.
+        calendar_id (str): The target calendar ID.
+        event_ids (List[str]): The IDs of the events to delete.
+        dry_run (bool): If True, logs the planned deletions without performing them.
+
+    Returns:
+        int: The number of events that were deleted (always 0 in dry-run mode).
+
+    Behavior:
+        - If dry_run is True, logs each planned deletion via delete_google_event.
+        - Events already deleted or not found (HTTP 404 or 410) are logged as warnings.
+        - Other errors are logged and execution continues with the remaining events.
+    """
+    if dry_run:
+        for event_id in event_ids:
+            delete_google_event(service, calendar_id, event_id, dry_run)
+        return 0
+
+    deleted_ids: List[str] = []
+
+    def _on_delete(request_id: str, response: Any, exception: Optional[Exception]) -> None:
+        if exception is None:
+            deleted_ids.append(request_id)
+            logging.info("Deleted event: %s from calendar %s", request_id, calendar_id)
+        elif isinstance(exception, HttpError) and exception.resp.status in [404, 410]:
+            logging.warning("Event %s already deleted or not found (Status: %s): %s", request_id, exception.resp.status, exception)
+        else:
+            logging.error("Error deleting event %s from calendar %s: %s", request_id, calendar_id, exception)
+
+    events_api = service.events()
+    for i in range(0, len(event_ids), BATCH_SIZE):
+        batch = service.new_batch_http_request(callback=_on_delete)
+        for event_id in event_ids[i:i + BATCH_SIZE]:
+            batch.add(events_api.delete(calendarId=calendar_id, eventId=event_id), request_id=event_id)
+        try:
+            batch.execute()
+        except Exception as e:
+            logging.error("An unexpected error occurred while executing delete batch for calendar %s: %s", calendar_id, e)
+    return len(deleted_ids)
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(description="Delete Hayward Tennis Sync events from Google Calendar")
     parser.add_argument("--dry-run", action="store_true", help="Log actions without actually deleting events")
@@ -156,7 +249,7 @@ def main() -> None:
     # Set up logging to stdout
     log_level = logging.DEBUG if args.dry_run else logging.INFO # More verbose logging in dry-run
     logging.basicConfig(level=log_level, stream=sys.stdout, format='%(asctime)s - %(levelname)s - %(message)s')
-    logging.info(f"Starting event deletion script. Dry run: {args.dry_run}")
+    logging.info("Starting event deletion script. Dry run: %s", args.dry_run)
 
     # Determine credentials path from command-line argument
     credentials_path: str = args.credentials_path
@@ -173,39 +266,36 @@ def main() -> None:
     time_min_iso: str = start_date.strftime("%Y-%m-%d") + "T00:00:00"
     time_max_iso: str = end_date.strftime("%Y-%m-%d") + "T00:00:00"
 
-    logging.info(f"Targeting events from {time_min_iso} up to (but not including) {time_max_iso} [{args.days} days]")
+    logging.info("Targeting events from %s up to (but not including) %s [%s days]", time_min_iso, time_max_iso, args.days)
+
+    # Get existing events within the date range that match the script's pattern, listing all calendars concurrently
+    events_by_location = fetch_all_calendar_events(credentials_path, LOCATION_TO_CALENDAR, time_min_iso, time_max_iso)
 
     total_deleted_count = 0
     # Process each location/calendar
     for location, calendar_id in LOCATION_TO_CALENDAR.items():
-        logging.info(f"--- Processing calendar for location: {location} ({calendar_id}) ---")
+        logging.info("--- Processing calendar for location: %s (%s) ---", location, calendar_id)
 
-        # Get existing events within the date range that match the script's pattern
-        events_to_delete = fetch_calendar_events(service, calendar_id, time_min_iso, time_max_iso)
+        events_to_delete = events_by_location[location]
 
         if not events_to_delete:
-            logging.info(f"No matching events found to delete for {location}.")
+            logging.info("No matching events found to delete for %s.", location)
             continue
 
-        logging.info(f"Found {len(events_to_delete)} events to potentially delete for {location}.")
+        logging.info("Found %s events to potentially delete for %s.", len(events_to_delete), location)
 
-        # Delete each found event
-        deleted_count_for_calendar = 0
-        for event in events_to_delete:
-            delete_google_event(service, calendar_id, event["id"], args.dry_run)
-            if not args.dry_run: # Only count if not dry run and deletion didn't raise critical error
-                 deleted_count_for_calendar += 1 # Simplistic count, assumes delete worked if no error logged
+        # Delete the found events in batches
+        deleted_count_for_calendar = delete_google_events_batch(service, calendar_id, [event["id"] for event in events_to_delete], args.dry_run)
 
-        logging.info(f"Finished processing for {location}. {'Would have attempted' if args.dry_run else 'Attempted'} deletion of {len(events_to_delete)} events.")
+        logging.info("Finished processing for %s. %s deletion of %s events.", location, 'Would have attempted' if args.dry_run else 'Attempted', len(events_to_delete))
         total_deleted_count += deleted_count_for_calendar if not args.dry_run else len(events_to_delete)
 
 
     logging.info("--- Script execution completed. ---")
     if args.dry_run:
-        logging.info(f"[Dry-run] Would have attempted to delete {total_deleted_count} events in total.")
+        logging.info("[Dry-run] Would have attempted to delete %s events in total.", total_deleted_count)
     else:
-        # Note: This count might be slightly off if specific deletions failed silently (like 404/410)
-        logging.info(f"Attempted deletion of approximately {total_deleted_count} events in total.")
+        logging.info("Deleted %s events in total.", total_deleted_count)
 
 
 if __name__ == "__main__":
@@ -1,37 +1,95 @@
 import argparse
+import concurrent.futures
 import datetime
+import functools
+import itertools
 import json
 import logging
+import os
 import re
+import sqlite3
 import sys
+import threading
 import time
+import orjson
 import requests
-from typing import List, Tuple, Any, Optional
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Container, Dict, Iterator, List, Tuple, Any, Optional
 from zoneinfo import ZoneInfo
 from google.oauth2 import service_account
 from googleapiclient.discovery import build
+from googleapiclient.errors import HttpError
 
 # Constants
 TIMEZONE: str = 'America/Los_Angeles'
+_TZ: ZoneInfo = ZoneInfo(TIMEZONE)
 LOCATION_TO_CALENDAR = {
     "Mervin": "c1b24574cbbcfe3d62b323de33ebc50956edf9212737a88f9423c661c5e37204@group.calendar.google.com",
     "Bay": "8320fe0a847ce736584415a3777a3d4eb69e650d459ae9329fa1aaed42cf36d1@group.calendar.google.com"
 }
 DEFAULT_THROTTLE: float = 5.0
+EVENT_SOURCE: str = "hayward_sync" # Tag stored in extendedProperties.private.source of created events
+DEFAULT_CONCURRENCY: int = 4
+DEFAULT_CACHE_TTL: float = 900.0 # Seconds a cached day of parsed reservation data stays fresh
+BATCH_SIZE: int = 50 # Calendar API limit for requests per batch HTTP call
+REQUEST_TIMEOUT: Tuple[float, float] = (5, 30) # (connect, read) timeouts in seconds for Hayward requests
+SLOT_DURATION: datetime.timedelta = datetime.timedelta(minutes=30)
+SLOTS_PER_DAY: int = 48
+# Finds: window.__csrfToken = "TOKEN_VALUE"; and captures the token inside the double quotes.
+# Assumes the token consists of hex characters and hyphens (like a UUID).
+_CSRF_RE: re.Pattern = re.compile(r'window\.__csrfToken\s*=\s*"([a-fA-F0-9\-]+)"')
 
 # Set up session
 session: requests.Session = requests.Session()
 session.headers.update({'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'}) # Example User Agent
+# Keep connections to the Hayward host alive across requests and retry transient failures with backoff.
+# The availability POST is a read-only query, so it is safe to retry.
+session.mount('https://', HTTPAdapter(
+    pool_connections=1,
+    pool_maxsize=16,
+    max_retries=Retry(total=5, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504], allowed_methods=["GET", "POST"])
+))
+
+
+class RateLimiter:
+    """
+    Thread-safe token bucket that limits how often requests are sent.
+
+    Up to `burst` requests may go out immediately; after that one token is refilled
+    every `interval` seconds. Callers that find the bucket empty reserve the next
+    token and sleep until it is due, outside of the lock.
+    """
+
+    def __init__(self, interval: float, burst: int = 1) -> None:
+        self.interval: float = interval
+        self.burst: int = burst
+        self._tokens: float = float(burst)
+        self._last: float = time.monotonic()
+        self._lock: threading.Lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Blocks until the caller may send a request."""
+        if self.interval <= 0:
+            return
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(float(self.burst), self._tokens + (now - self._last) / self.interval)
+            self._last = now
+            self._tokens -= 1
+            wait = -self._tokens * self.interval if self._tokens < 0 else 0.0
+        if wait > 0:
+            time.sleep(wait)
 
 
 def get_sync_date_range(num_days: int = 85) -> List[str]:
     """
     Calculates and returns a list of date strings for the sync range.
-    Start date is today + 2 days, end date is today + 81 days (80 days total).
+    Start date is today + 2 days, end date is today + num_days + 1 days (num_days days total).
     """
     start_date = datetime.date.today() + datetime.timedelta(days=2)
-    # Create a list of 80 days starting from start_date
-    return [(start_date + datetime.timedelta(days=i)).strftime("%Y-%m-%d") for i in range(num_days)]
+    # Create a list of num_days days starting from start_date; isoformat yields YYYY-MM-DD without strftime
+    return [(start_date + datetime.timedelta(days=i)).isoformat() for i in range(num_days)]
 
 def find_csrf_token(html_content: str) -> Optional[str]:
     """
@@ -44,17 +102,11 @@ def find_csrf_token(html_content: str) -> Optional[str]:
     Returns:
         The extracted CSRF token string, or None if not found.
     """
-    # Regex pattern to find: window.__csrfToken = "TOKEN_VALUE";
-    # It captures the sequence of characters inside the double quotes.
-    # Assumes the token consists of hex characters and hyphens (like a UUID).
-    # Escape dots in '__csrfToken' as '.' is a special regex character.
-    pattern = r'window\.__csrfToken\s*=\s*"([a-fA-F0-9\-]+)"' # Added \s* for robustness
-
-    match = re.search(pattern, html_content)
+    match = _CSRF_RE.search(html_content)
 
     if match:
         token = match.group(1)
-        logging.info(f"Successfully extracted CSRF token: {token[:4]}...{token[-4:]}") # Log partial token
+        logging.info("Successfully extracted CSRF token: %s...%s", token[:4], token[-4:]) # Log partial token
         return token
     else:
         logging.warning("Could not find CSRF token pattern (window.__csrfToken = \"...\") in the HTML content.")
@@ -62,10 +114,10 @@ def find_csrf_token(html_content: str) -> Optional[str]:
 
 def get_csrf_token() -> Optional[str]:
     initial_url: str = "https://anc.apm.activecommunities.com/haywardrec/reservation/landing/quick?locale=en-US&groupId=2"
-    logging.info(f"Making initial request to {initial_url} to establish session...")
-    initial_response = session.get(initial_url, timeout=30)
+    logging.info("Making initial request to %s to establish session...", initial_url)
+    initial_response = session.get(initial_url, timeout=REQUEST_TIMEOUT)
     initial_response.raise_for_status()
-    logging.info(f"Initial request successful (Status: {initial_response.status_code}).")
+    logging.info("Initial request successful (Status: %s).", initial_response.status_code)
     csrf_token = find_csrf_token(initial_response.text)
     if csrf_token:
         logging.info("Extracted CSRF token.")
@@ -73,12 +125,14 @@ def get_csrf_token() -> Optional[str]:
         logging.warning("Could not find CSRF token. Proceeding without it, might fail.")
     return csrf_token
 
-def fetch_hayward_data(date_str: str, throttle_seconds: float, csrf_token: Optional[str]) -> bytes:
+def fetch_hayward_data(date_str: str, csrf_token: Optional[str], http_session: requests.Session = session) -> bytes:
     """
-    Fetches data from the Hayward API for a given date with throttling.
+    Fetches data from the Hayward API for a given date.
     
     Constructs the URL using the provided date_str.
-    Implements throttling using time.sleep(throttle_seconds) before making the request.
+    Sends the request through http_session (the shared keep-alive session by default).
+    Throttling is up to the caller (see fetch_all_hayward_data).
+    HTTP 429 responses are retried by the session, honoring the server's Retry-After header.
     
     Returns the raw response content (JSON).
     """
@@ -102,13 +156,56 @@ def fetch_hayward_data(date_str: str, throttle_seconds: float, csrf_token: Optio
         "reload": False,
         "change_time_range": False
     }
-    # Throttle
-    time.sleep(throttle_seconds)
-    response = session.post(url, json=payload, headers=headers, timeout=30)
+    response = http_session.post(url, json=payload, headers=headers, timeout=REQUEST_TIMEOUT)
     response.raise_for_status()
     return response.content
 
-def parse_reservation_data(json_data: bytes, reserve_date: Optional[str] = None) -> dict:
+def fetch_all_hayward_data(dates: List[str], throttle_seconds: float, csrf_token: Optional[str], max_workers: int = DEFAULT_CONCURRENCY) -> Iterator[Tuple[str, Optional[bytes]]]:
+    """
+    Fetches data from the Hayward API for several dates concurrently.
+
+    Each date is fetched with fetch_hayward_data on a bounded thread pool, so up to
+    max_workers requests are in flight at once. Requests share a RateLimiter that
+    allows a burst of max_workers requests and then one request every throttle_seconds.
+
+    Yields (date_str, raw response content) pairs in completion order, so callers can
+    process and release each payload while the remaining requests are still running.
+    A date whose request still fails after the session's retries is logged and yielded
+    with None as its content, so the other dates can still be synced.
+    At most 2 * max_workers dates are submitted but not yet consumed, so a slow
+    consumer applies back-pressure instead of letting responses pile up.
+    """
+    rate_limiter = RateLimiter(throttle_seconds, burst=max_workers)
+
+    def _fetch(date_str: str) -> bytes:
+        rate_limiter.acquire()
+        return fetch_hayward_data(date_str, csrf_token)
+
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=max_workers)
+    max_pending = 2 * max_workers
+    pending: Dict[concurrent.futures.Future, str] = {}
+    remaining = iter(dates)
+    try:
+        while True:
+            for date_str in itertools.islice(remaining, max_pending - len(pending)):
+                pending[executor.submit(_fetch, date_str)] = date_str
+            if not pending:
+                break
+            done, _ = concurrent.futures.wait(pending, return_when=concurrent.futures.FIRST_COMPLETED)
+            for future in done:
+                date_str = pending.pop(future)
+                try:
+                    raw_data = future.result()
+                except requests.RequestException as e:
+                    logging.error("Failed to fetch data for %s: %s", date_str, e)
+                    yield date_str, None
+                    continue
+                logging.info("Fetched data for %s.", date_str)
+                yield date_str, raw_data
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+def parse_reservation_data(json_data: bytes, reserve_date: Optional[str] = None, locations: Optional[Container[str]] = None) -> dict:
     """
     Parses the raw JSON data from the Hayward API to extract reservation data.
 
@@ -118,22 +215,25 @@ def parse_reservation_data(json_data: bytes, reserve_date: Optional[str] = None)
        Each resource with a "resource_name" containing "Tennis Court" is processed.
        The resource name is expected to be in the format "Location - Tennis Court X".
        Time slot details from "time_slot_details" are matched with "time_slots" to determine reservation status.
-       The resulting structure is:
+       Only reserved slots are included. The resulting structure is:
        
        {
            "requested_date": {
                "Location": {
-                   "Court X": {"HH:MM": True/False, ...},
+                   "Court X": {"HH:MM": True, ...},
                    ...
                },
                ...
            }
        }
+
+    If locations is given, resources of any other location are skipped before their
+    time slots are examined.
     
     Raises:
         ValueError: if the JSON data is invalid or missing required keys.
     """
-    data: Any = json.loads(json_data.decode("utf-8"))
+    data: Any = orjson.loads(json_data)
 
     if "body" in data and "availability" in data["body"]:
         avail: dict = data["body"]["availability"]
@@ -148,36 +248,128 @@ def parse_reservation_data(json_data: bytes, reserve_date: Optional[str] = None)
             date_str: str = reserve_date
         else:
             date_str: str = "requested_date"
-        result: dict = {date_str: {}}
+        day_result: dict = {}
+        result: dict = {date_str: day_result}
+        # Every court shares the same "HH:MM" keys, so slice and intern them once per response
+        slot_keys: List[str] = [sys.intern(t[:5]) for t in time_slots]
         for res in resources:
             resource_name: Optional[str] = res.get("resource_name")
             if resource_name and "Tennis Court" in resource_name:
                 parts: List[str] = resource_name.split(" - ")
                 if len(parts) != 2:
                     continue
-                location: str = parts[0]
+                location: str = sys.intern(parts[0])
+                if locations is not None and location not in locations:
+                    continue
                 court_full: str = parts[1]
-                court_name: str = court_full.replace("Tennis Court ", "Court ")
-                if location not in result[date_str]:
-                    result[date_str][location] = {}
+                if court_full.startswith("Tennis Court "):
+                    court_name: str = sys.intern("Court " + court_full.removeprefix("Tennis Court "))
+                else:
+                    court_name: str = sys.intern(court_full)
                 details: List[dict] = res.get("time_slot_details")
                 if not isinstance(details, list):
                     raise ValueError("Expected 'time_slot_details' to be a list")
-                slot_status: dict = {}
-                for idx, t in enumerate(time_slots):
-                    time_key: str = t[:5]
-                    if idx < len(details):
-                        detail: dict = details[idx]
-                        reserved: bool = (detail.get("status") == 1)
-                        slot_status[time_key] = reserved
-                    else:
-                        slot_status[time_key] = False
-                result[date_str][location][court_name] = slot_status
+                try:
+                    # Only booked slots are recorded; slots without details are not reserved
+                    slot_status: dict = {t: True for t, detail in zip(slot_keys, details) if detail.get("status") == 1}
+                except AttributeError as e:
+                    raise ValueError(f"Malformed time slot data for {resource_name}: {e}")
+                day_result.setdefault(location, {})[court_name] = slot_status
         return result
     else:
-        print(data)
+        logging.debug("Unexpected payload keys: %s", list(data)[:20] if isinstance(data, dict) else type(data).__name__)
         raise ValueError("JSON data missing required 'body' or 'availability' keys")
 
+def load_cached_day(cache_dir: str, date_str: str, ttl_seconds: float) -> Optional[dict]:
+    """
+    Loads the parsed reservation data for a date from the on-disk cache.
+
+    Returns:
+        The parsed data as returned by parse_reservation_data, or None if there is no
+        cache entry, it is older than ttl_seconds, or it cannot be read.
+    """
+    path = os.path.join(cache_dir, f"{date_str}.json")
+    try:
+        if time.time() - os.path.getmtime(path) > ttl_seconds:
+            return None
+        with open(path, "rb") as f:
+            return orjson.loads(f.read())
+    except (OSError, ValueError):
+        return None
+
+def store_cached_day(cache_dir: str, date_str: str, parsed_data: dict) -> None:
+    """
+    Stores the parsed reservation data for a date in the on-disk cache.
+    The file is written to a temporary name first so readers never see a partial entry.
+    The cache is optional, so a failed write is logged and otherwise ignored.
+    """
+    path = os.path.join(cache_dir, f"{date_str}.json")
+    tmp_path = f"{path}.tmp"
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        with open(tmp_path, "w") as f:
+            json.dump(parsed_data, f)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        logging.warning("Could not write cache entry for %s: %s", date_str, e)
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+def _slot_iso_table(date_str: str) -> List[str]:
+    """
+    Builds the ISO 8601 timestamps of every 30-minute slot boundary on a date.
+
+    Index i is midnight plus i slots; the final entry is midnight of the next day.
+    The UTC offset is formatted once per date, unless the date has a DST transition,
+    in which case each slot's offset is resolved individually.
+    """
+    base = datetime.datetime.fromisoformat(date_str).replace(tzinfo=_TZ)
+    next_midnight = base + datetime.timedelta(days=1)
+    if base.utcoffset() != next_midnight.utcoffset():
+        return [(base + SLOT_DURATION * i).isoformat() for i in range(SLOTS_PER_DAY)] + [next_midnight.isoformat()]
+    offset = base.isoformat()[19:]
+    return [f"{date_str}T{i // 2:02d}:{i % 2 * 30:02d}:00{offset}" for i in range(SLOTS_PER_DAY)] + [next_midnight.isoformat()]
+
+def consolidate_day(date_str: str, locations: dict, consolidated: Optional[dict] = None) -> dict:
+    """
+    Consolidates the booked slots of a single date into start/end ISO 8601 time ranges.
+
+    Args:
+        date_str (str): The date the slots belong to (YYYY-MM-DD).
+        locations (dict): That date's parsed data, {location: {court: {"HH:MM": booked}}}.
+        consolidated (dict, optional): Result to add the date's events to; a new dict is used if omitted.
+
+    Returns:
+        dict: consolidated, in the structure returned by consolidate_booked_slots.
+    """
+    if consolidated is None:
+        consolidated = {}
+    # Every slot is an integer number of 30-minute steps from midnight, looked up in a per-date table
+    slot_iso: List[str] = _slot_iso_table(date_str)
+    for location, courts in locations.items():
+        for court, slots in courts.items():
+            # Pack the booked timeslots into a bitmask with bit i set for slot index i ("HH:MM" -> HH * 2 + MM // 30)
+            mask = 0
+            for t, is_booked in slots.items():
+                if is_booked:
+                    mask |= 1 << (int(t[:2]) * 2 + int(t[3:5]) // 30)
+            if not mask:
+                continue
+            events = []
+            # Peel off one run of consecutive booked slots per iteration
+            while mask:
+                lowest = mask & -mask
+                run_start = lowest.bit_length() - 1
+                # Adding the lowest bit carries through the run, clearing it and setting the bit just past its end
+                carried = mask + lowest
+                run_end = (carried & -carried).bit_length() - 2
+                events.append((slot_iso[run_start + 1], slot_iso[run_end]))
+                mask &= carried
+            consolidated.setdefault(location, {}).setdefault(court, []).extend(events)
+    return consolidated
+
 def consolidate_booked_slots(parsed_data: dict) -> dict:
     """
     Consolidates booked slots from parsed reservation data.
@@ -198,40 +390,20 @@ def consolidate_booked_slots(parsed_data: dict) -> dict:
 
     consolidated = {}
     for date_str, locations in parsed_data.items():
-        for location, courts in locations.items():
-            for court, slots in courts.items():
-                # Filter and sort timeslots that are booked
-                booked_times = [time_str for time_str, is_booked in slots.items() if is_booked]
-                if not booked_times:
-                    continue
-                booked_times.sort()
-                events = []
-                fmt: str = "%Y-%m-%d %H:%M"
-                tz: ZoneInfo = ZoneInfo(TIMEZONE)
-                current_start = None
-                current_end = None
-                for t in booked_times:
-                    slot_dt = datetime.datetime.strptime(f"{date_str} {t}", fmt)
-                    slot_dt = slot_dt.replace(tzinfo=tz)
-                    if current_start is None:
-                        current_start = slot_dt
-                        current_end = slot_dt + datetime.timedelta(minutes=30)
-                    else:
-                        if slot_dt == current_end:
-                            current_end += datetime.timedelta(minutes=30)
-                        else:
-                            events.append(((current_start + datetime.timedelta(minutes=30)).isoformat(), (current_end - datetime.timedelta(minutes=30)).isoformat()))
-                            current_start = slot_dt
-                            current_end = slot_dt + datetime.timedelta(minutes=30)
-                if current_start is not None:
-                    events.append(((current_start + datetime.timedelta(minutes=30)).isoformat(), (current_end - datetime.timedelta(minutes=30)).isoformat()))
-                if location not in consolidated:
-                    consolidated[location] = {}
-                if court not in consolidated[location]:
-                    consolidated[location][court] = []
-                consolidated[location][court].extend(events)
+        consolidate_day(date_str, locations, consolidated)
     return consolidated
 
+@functools.lru_cache(maxsize=4)
+def _load_credentials(credentials_path: str) -> service_account.Credentials:
+    """
+    Loads the service account credentials from credentials_path once per path.
+
+    Sharing one Credentials object lets every service built from it reuse the same
+    access token instead of each fetching its own.
+    """
+    scopes = ['https://www.googleapis.com/auth/calendar.events']
+    return service_account.Credentials.from_service_account_file(credentials_path, scopes=scopes)
+
 def authenticate_google(credentials_path: str) -> Any:
     """
     Authenticates to Google Calendar API using a service account credentials file.
@@ -245,9 +417,9 @@ def authenticate_google(credentials_path: str) -> Any:
     Raises:
         Exception: If credential loading or service creation fails.
     """
-    scopes = ['https://www.googleapis.com/auth/calendar.events']
-    credentials = service_account.Credentials.from_service_account_file(credentials_path, scopes=scopes)
-    service = build('calendar', 'v3', credentials=credentials)
+    credentials = _load_credentials(credentials_path)
+    # Use the discovery document bundled with google-api-python-client instead of fetching it over HTTP
+    service = build('calendar', 'v3', credentials=credentials, static_discovery=True, cache_discovery=False)
     return service
 
 def fetch_calendar_events(service: Any, calendar_id: str, time_min_iso: str, time_max_iso: str) -> List[dict]:
@@ -267,19 +439,22 @@ def fetch_calendar_events(service: Any, calendar_id: str, time_min_iso: str, tim
     """
     events: List[dict] = []
     page_token: Optional[str] = None
+    # The time bounds are the same for every page, so convert them to RFC3339 once
+    time_min_rfc3339 = datetime.datetime.fromisoformat(time_min_iso).replace(tzinfo=_TZ).isoformat()
+    time_max_rfc3339 = datetime.datetime.fromisoformat(time_max_iso).replace(tzinfo=_TZ).isoformat()
+    logging.debug("Fetching events for calendar %s between %s and %s", calendar_id, time_min_rfc3339, time_max_rfc3339)
+    events_api = service.events()
     while True:
-        tz = ZoneInfo(TIMEZONE)
-        time_min_rfc3339 = datetime.datetime.fromisoformat(time_min_iso).replace(tzinfo=tz).isoformat()
-        time_max_rfc3339 = datetime.datetime.fromisoformat(time_max_iso).replace(tzinfo=tz).isoformat()
-        print(time_min_rfc3339)
-        print(time_max_rfc3339)
-        response = service.events().list(
+        response = events_api.list(
             calendarId=calendar_id,
             timeMin=time_min_rfc3339,
             timeMax=time_max_rfc3339,
             singleEvents=True,
             orderBy='startTime',
-            pageToken=page_token
+            pageToken=page_token,
+            maxResults=2500,
+            fields="items(id,summary,start(dateTime,date),end(dateTime,date)),nextPageToken",
+            q="Court "
         ).execute()
         for event in response.get('items', []):
             summary = event.get("summary", "")
@@ -298,44 +473,100 @@ def fetch_calendar_events(service: Any, calendar_id: str, time_min_iso: str, tim
             break
     return events
 
+def fetch_events_by_calendar_id(credentials_path: str, calendar_ids: List[str], time_min_iso: str, time_max_iso: str) -> Dict[str, List[dict]]:
+    """
+    Fetches existing calendar events for several calendars concurrently.
+
+    Each calendar is listed in its own worker thread; pagination within a calendar stays
+    sequential. The underlying httplib2 transport is not thread-safe, so every worker
+    builds its own Calendar API service object.
+
+    Returns:
+        Dict[str, List[dict]]: The events returned by fetch_calendar_events, keyed by calendar ID.
+        Calendars that could not be listed are logged and left out.
+    """
+    def _fetch(calendar_id: str) -> List[dict]:
+        return fetch_calendar_events(authenticate_google(credentials_path), calendar_id, time_min_iso, time_max_iso)
+
+    results: Dict[str, List[dict]] = {}
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max(len(calendar_ids), 1)) as executor:
+        futures = {executor.submit(_fetch, calendar_id): calendar_id for calendar_id in calendar_ids}
+        for future in concurrent.futures.as_completed(futures):
+            calendar_id = futures[future]
+            try:
+                results[calendar_id] = future.result()
+            except Exception as e:
+                logging.warning("Failed to fetch events for calendar %s: %s", calendar_id, e)
+    return results
+
+@functools.lru_cache(maxsize=4096)
+def _event_time_key(iso_str: str) -> int:
+    """
+    Converts an ISO 8601 timestamp to epoch seconds so that equal instants compare equal
+    regardless of how their UTC offset is written. Timestamps without an offset are
+    taken to be in TIMEZONE.
+    """
+    dt = datetime.datetime.fromisoformat(iso_str)
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=_TZ)
+    return int(dt.timestamp())
+
+def _event_local_date(iso_str: str) -> str:
+    """
+    Returns the date (YYYY-MM-DD) in TIMEZONE on which an event starting at iso_str begins.
+    Date-only values (all-day events) are returned as-is; timestamps in any UTC offset
+    are converted to TIMEZONE first.
+    """
+    if len(iso_str) == 10:
+        return iso_str
+    dt = datetime.datetime.fromisoformat(iso_str)
+    if dt.tzinfo is None:
+        return dt.date().isoformat()
+    return dt.astimezone(_TZ).date().isoformat()
+
 def diff_events(desired_slots: dict, existing_events: List[dict], location_name: str) -> Tuple[List[dict], List[str]]:
     """
     Compares desired_slots (desired events) with existing_events fetched from the calendar.
-    Each desired event is represented as a tuple (court, start_iso, end_iso).
+    Each event is compared as a tuple (court, epoch_start, epoch_end) built with _event_time_key.
     
     Returns:
         events_to_create: a list of dictionaries with keys 'summary', 'start', 'end'
                           representing new events that need to be created.
         events_to_delete: a list of event IDs from existing_events that are no longer desired.
     """
-    desired_tuples: set = set()
-    desired_events: List[dict] = []
-    for court, events in desired_slots.items():
-        for (start, end) in events:
-            event_tuple = (court, start, end)
-            desired_tuples.add(event_tuple)
-            desired_events.append({"summary": court, "start": start, "end": end})
-            
-    existing_tuples: set = set()
-    for event in existing_events:
-        event_tuple = (event["summary"], event["start"], event["end"])
-        existing_tuples.add(event_tuple)
-    
-    events_to_create: List[dict] = []
-    for event in desired_events:
-        event_tuple = (event["summary"], event["start"], event["end"])
-        if event_tuple not in existing_tuples:
-            events_to_create.append(event)
+    # Key every event once; the keyed lists keep the sources' order for the results below
+    desired_keyed: List[Tuple[tuple, str, str, str]] = [
+        ((court, _event_time_key(start), _event_time_key(end)), court, start, end)
+        for court, events in desired_slots.items() for (start, end) in events
+    ]
+    existing_keyed: List[Tuple[tuple, str]] = [
+        ((event["summary"], _event_time_key(event["start"]), _event_time_key(event["end"])), event["id"])
+        for event in existing_events
+    ]
+    desired_tuples: set = {key for key, _, _, _ in desired_keyed}
+    existing_tuples: set = {key for key, _ in existing_keyed}
     
-    events_to_delete: List[str] = []
-    for event in existing_events:
-        event_tuple = (event["summary"], event["start"], event["end"])
-        if event_tuple not in desired_tuples:
-            events_to_delete.append(event["id"])
+    # Iterate the sources rather than the set differences to keep a stable, chronological order
+    events_to_create: List[dict] = [
+        {"summary": court, "start": start, "end": end}
+        for key, court, start, end in desired_keyed if key not in existing_tuples
+    ]
+    events_to_delete: List[str] = [event_id for key, event_id in existing_keyed if key not in desired_tuples]
     
-    logging.info(f"Location {location_name}: {len(events_to_create)} events to create, {len(events_to_delete)} events to delete")
+    logging.info("Location %s: %s events to create, %s events to delete", location_name, len(events_to_create), len(events_to_delete))
     return events_to_create, events_to_delete
 
+def build_event_body(court_name: str, start_iso: str, end_iso: str, timezone: str) -> dict:
+    """
+    Builds the Calendar API event resource for a court booking, tagged as created by this script.
+    """
+    return {
+        "summary": court_name,
+        "start": {"dateTime": start_iso, "timeZone": timezone},
+        "end": {"dateTime": end_iso, "timeZone": timezone},
+        "extendedProperties": {"private": {"source": EVENT_SOURCE}}
+    }
+
 def create_google_event(service: Any, calendar_id: str, court_name: str, start_iso: str, end_iso: str, timezone: str, dry_run: bool) -> Optional[dict]:
     """
     Creates a Google Calendar event for a given court time slot.
@@ -352,20 +583,16 @@ def create_google_event(service: Any, calendar_id: str, court_name: str, start_i
     Returns:
         dict: Details of the created event if not in dry-run mode, otherwise None.
     """
-    event_body = {
-        "summary": court_name,
-        "start": {"dateTime": start_iso, "timeZone": timezone},
-        "end": {"dateTime": end_iso, "timeZone": timezone}
-    }
+    event_body = build_event_body(court_name, start_iso, end_iso, timezone)
     if dry_run:
-        logging.info(f"[Dry-run] Would create event: {event_body}")
+        logging.info("[Dry-run] Would create event: %s", event_body)
         return None
     try:
         event = service.events().insert(calendarId=calendar_id, body=event_body).execute()
-        logging.info(f"Created event: {event.get('id')}")
+        logging.info("Created event: %s", event.get('id'))
         return event
     except Exception as e:
-        logging.error(f"Error creating Google Calendar event for {court_name} from {start_iso} to {end_iso}: {e}")
+        logging.error("Error creating Google Calendar event for %s from %s to %s: %s", court_name, start_iso, end_iso, e)
         sys.exit(1)
 
 def delete_google_event(service: Any, calendar_id: str, event_id: str, dry_run: bool) -> None:
@@ -385,28 +612,224 @@ def delete_google_event(service: Any, calendar_id: str, event_id: str, dry_run:
         - For other errors, logs the error and exits.
     """
     if dry_run:
-        logging.info(f"[Dry-run] Would delete event: {event_id} from calendar {calendar_id}")
+        logging.info("[Dry-run] Would delete event: %s from calendar %s", event_id, calendar_id)
         return None
     try:
         service.events().delete(calendarId=calendar_id, eventId=event_id).execute()
-        logging.info(f"Deleted event: {event_id} from calendar {calendar_id}")
+        logging.info("Deleted event: %s from calendar %s", event_id, calendar_id)
     except Exception as e:
         if '404' in str(e):
-            logging.warning(f"Event {event_id} already deleted or not found: {e}")
+            logging.warning("Event %s already deleted or not found: %s", event_id, e)
         else:
-            logging.error(f"Error deleting event {event_id}: {e}")
+            logging.error("Error deleting event %s: %s", event_id, e)
             sys.exit(1)
     return None
 
+def apply_event_changes(service: Any, calendar_id: str, events_to_create: List[dict], events_to_delete: List[str], timezone: str, dry_run: bool) -> Tuple[List[Tuple[dict, dict]], List[str]]:
+    """
+    Creates and deletes Google Calendar events using batch HTTP requests.
+
+    Inserts and deletes are grouped into batches of up to BATCH_SIZE requests, so each
+    batch costs a single HTTP round-trip instead of one per event.
+
+    Args:
+        service: Authorized Google Calendar API service object.
+        calendar_id (str): Target calendar ID.
+        events_to_create (List[dict]): Events with keys 'summary', 'start', 'end', as returned by diff_events.
+        events_to_delete (List[str]): IDs of the events to delete.
+        timezone (str): Timezone identifier.
+        dry_run (bool): If True, logs the planned changes without performing them.
+
+    Returns:
+        created: (desired event, created event resource) pairs.
+        deleted: IDs of the events that were deleted or were already gone.
+
+    Behavior:
+        - If the event to delete is already deleted or not found (HTTP 404 or 410), logs a warning.
+        - For other errors, logs the error and exits once the current batch completes.
+    """
+    if dry_run:
+        for event in events_to_create:
+            create_google_event(service, calendar_id, event["summary"], event["start"], event["end"], timezone, dry_run)
+        for event_id in events_to_delete:
+            delete_google_event(service, calendar_id, event_id, dry_run)
+        return [], []
+
+    requests_by_id: Dict[str, Tuple[str, Any]] = {}
+    for idx, event in enumerate(events_to_create):
+        requests_by_id[f"create-{idx}"] = ("create", event)
+    for idx, event_id in enumerate(events_to_delete):
+        requests_by_id[f"delete-{idx}"] = ("delete", event_id)
+
+    created: List[Tuple[dict, dict]] = []
+    deleted: List[str] = []
+    failed: List[str] = []
+
+    def _on_response(request_id: str, response: Any, exception: Optional[Exception]) -> None:
+        action, item = requests_by_id[request_id]
+        if action == "create":
+            if exception is None:
+                created.append((item, response))
+                logging.info("Created event: %s", response.get('id'))
+            else:
+                logging.error("Error creating Google Calendar event for %s from %s to %s: %s", item["summary"], item["start"], item["end"], exception)
+                failed.append(request_id)
+        elif exception is None:
+            deleted.append(item)
+            logging.info("Deleted event: %s from calendar %s", item, calendar_id)
+        elif isinstance(exception, HttpError) and exception.resp.status in (404, 410):
+            deleted.append(item)
+            logging.warning("Event %s already deleted or not found: %s", item, exception)
+        else:
+            logging.error("Error deleting event %s: %s", item, exception)
+            failed.append(request_id)
+
+    request_ids = list(requests_by_id)
+    events_api = service.events()
+    for i in range(0, len(request_ids), BATCH_SIZE):
+        batch = service.new_batch_http_request(callback=_on_response)
+        for request_id in request_ids[i:i + BATCH_SIZE]:
+            action, item = requests_by_id[request_id]
+            if action == "create":
+                request = events_api.insert(calendarId=calendar_id, body=build_event_body(item["summary"], item["start"], item["end"], timezone))
+            else:
+                request = events_api.delete(calendarId=calendar_id, eventId=item)
+            batch.add(request, request_id=request_id)
+        batch.execute()
+        if failed:
+            sys.exit(1)
+    return created, deleted
+
+def open_state_db(state_path: str) -> sqlite3.Connection:
+    """
+    Opens (and creates if needed) the local SQLite database recording the events this script manages.
+
+    Tables:
+        events: one row per calendar event with its calendar ID, event ID, summary, start and end,
+            keyed by (calendar ID, event ID).
+        sync_tokens: the Calendar API sync token of each calendar, used for incremental listing.
+    """
+    conn = sqlite3.connect(state_path)
+    # Event IDs are only unique within a calendar. Files from before the events table was keyed
+    # by (calendar_id, event_id) are dropped, which makes the next run do a full sync.
+    pk_columns = [row[1] for row in conn.execute("PRAGMA table_info(events)") if row[5]]
+    if pk_columns == ["event_id"]:
+        conn.execute("DROP TABLE events")
+        conn.execute("DROP TABLE IF EXISTS sync_tokens")
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS events ("
+        "calendar_id TEXT NOT NULL, event_id TEXT NOT NULL, summary TEXT NOT NULL, start TEXT NOT NULL, end TEXT NOT NULL, "
+        "PRIMARY KEY (calendar_id, event_id))"
+    )
+    conn.execute("CREATE TABLE IF NOT EXISTS sync_tokens (calendar_id TEXT PRIMARY KEY, sync_token TEXT NOT NULL)")
+    conn.commit()
+    return conn
+
+def load_state_events(conn: sqlite3.Connection, calendar_id: str, start_date: str, end_date: str) -> List[dict]:
+    """
+    Loads the recorded events of a calendar whose start falls on a date in [start_date, end_date).
+
+    Returns:
+        List[dict]: Event dictionaries with keys 'id', 'summary', 'start', and 'end', like fetch_calendar_events.
+    """
+    rows = conn.execute(
+        "SELECT event_id, summary, start, end FROM events WHERE calendar_id = ? AND start >= ? AND start < ?",
+        (calendar_id, start_date, end_date)
+    ).fetchall()
+    return [{"id": event_id, "summary": summary, "start": start, "end": end} for event_id, summary, start, end in rows]
+
+def _list_event_changes(service: Any, calendar_id: str, sync_token: Optional[str]) -> Tuple[List[dict], Optional[str]]:
+    """
+    Lists all events of a calendar, or only those changed since sync_token if given.
+
+    Time bounds, ordering and text search cannot be combined with sync tokens, so the
+    whole calendar is listed. Returns the raw event items and the next sync token.
+    """
+    items: List[dict] = []
+    page_token: Optional[str] = None
+    events_api = service.events()
+    while True:
+        params: dict = {
+            "calendarId": calendar_id,
+            "singleEvents": True,
+            "maxResults": 2500,
+            "pageToken": page_token,
+            "fields": "items(id,status,summary,start(dateTime,date),end(dateTime,date)),nextPageToken,nextSyncToken"
+        }
+        if sync_token is not None:
+            params["syncToken"] = sync_token
+        response = events_api.list(**params).execute()
+        items.extend(response.get("items", []))
+        page_token = response.get("nextPageToken")
+        if not page_token:
+            return items, response.get("nextSyncToken")
+
+def sync_state_events(service: Any, conn: sqlite3.Connection, calendar_id: str, full_sync: bool = False) -> None:
+    """
+    Brings the recorded events of a calendar up to date with the Calendar API.
+
+    With a stored sync token only the events changed since the previous run are listed and
+    applied to the record. Without one (or when full_sync is set, or the token has expired
+    with HTTP 410 Gone) the calendar is listed in full and the record is rebuilt.
+    Only events with a summary starting with "Court " are recorded.
+    """
+    row = conn.execute("SELECT sync_token FROM sync_tokens WHERE calendar_id = ?", (calendar_id,)).fetchone()
+    sync_token: Optional[str] = None if full_sync or row is None else row[0]
+    try:
+        items, next_sync_token = _list_event_changes(service, calendar_id, sync_token)
+    except HttpError as e:
+        if sync_token is None or e.resp.status != 410:
+            raise
+        logging.info("Sync token for calendar %s expired, listing all events.", calendar_id)
+        sync_token = None
+        items, next_sync_token = _list_event_changes(service, calendar_id, None)
+
+    with conn:
+        if sync_token is None:
+            conn.execute("DELETE FROM events WHERE calendar_id = ?", (calendar_id,))
+        for item in items:
+            summary = item.get("summary", "")
+            if item.get("status") == "cancelled" or not summary.startswith("Court "):
+                conn.execute("DELETE FROM events WHERE calendar_id = ? AND event_id = ?", (calendar_id, item["id"]))
+                continue
+            start = item["start"].get("dateTime", item["start"].get("date"))
+            end = item["end"].get("dateTime", item["end"].get("date"))
+            conn.execute(
+                "INSERT OR REPLACE INTO events (calendar_id, event_id, summary, start, end) VALUES (?, ?, ?, ?, ?)",
+                (calendar_id, item["id"], summary, start, end)
+            )
+        if next_sync_token:
+            conn.execute("INSERT OR REPLACE INTO sync_tokens (calendar_id, sync_token) VALUES (?, ?)", (calendar_id, next_sync_token))
+    logging.info("Applied %s %s events to local state for calendar %s.", len(items), 'changed' if sync_token else 'listed', calendar_id)
+
+def record_state_event(conn: sqlite3.Connection, calendar_id: str, event_id: str, summary: str, start_iso: str, end_iso: str) -> None:
+    """Records an event created by this script."""
+    with conn:
+        conn.execute(
+            "INSERT OR REPLACE INTO events (calendar_id, event_id, summary, start, end) VALUES (?, ?, ?, ?, ?)",
+            (calendar_id, event_id, summary, start_iso, end_iso)
+        )
+
+def forget_state_event(conn: sqlite3.Connection, calendar_id: str, event_id: str) -> None:
+    """Removes a deleted event from the recorded state."""
+    with conn:
+        conn.execute("DELETE FROM events WHERE calendar_id = ? AND event_id = ?", (calendar_id, event_id))
+
 def main() -> None:
     parser = argparse.ArgumentParser(description="Hayward Tennis Sync Script")
     parser.add_argument("--dry-run", action="store_true", help="Execute in dry-run mode")
-    parser.add_argument("--throttle", type=float, default=DEFAULT_THROTTLE, help="Throttle delay in seconds")
+    parser.add_argument("--throttle", type=float, default=DEFAULT_THROTTLE, help="Average delay between requests in seconds")
+    parser.add_argument("--concurrency", type=int, default=DEFAULT_CONCURRENCY, help="Number of concurrent requests to the Hayward API")
     parser.add_argument("--credentials-path", required=True, help="Path to Google service account credentials file")
+    parser.add_argument("--state-path", help="Path to a local SQLite file recording synced events; lets runs list only calendar changes")
+    parser.add_argument("--log-level", default="INFO", choices=["DEBUG", "INFO", "WARNING", "ERROR"], help="Logging level (default: INFO)")
+    parser.add_argument("--cache-dir", help="Directory to cache parsed reservation data per date; fresh entries are not re-fetched")
+    parser.add_argument("--cache-ttl", type=float, default=DEFAULT_CACHE_TTL, help="Seconds a cached date stays fresh (default: 900)")
+    parser.add_argument("--full-sync", action="store_true", help="List the calendars in full instead of only changes since the last run")
     args: argparse.Namespace = parser.parse_args()
     
     # Set up logging to stdout
-    logging.basicConfig(level=logging.INFO, stream=sys.stdout, format='%(asctime)s - %(levelname)s - %(message)s')
+    logging.basicConfig(level=args.log_level, stream=sys.stdout, format='%(asctime)s - %(levelname)s - %(message)s')
     logging.info("Started hayward tennis sync script")
     
     # Determine credentials path from command-line argument
@@ -415,52 +838,102 @@ def main() -> None:
     
     # Determine sync date range
     sync_dates: List[str] = get_sync_date_range()
-    logging.info(f"Sync date range: {sync_dates[0]} to {sync_dates[-1]}")
+    logging.info("Sync date range: %s to %s", sync_dates[0], sync_dates[-1])
     
-    all_parsed_data = {}
-    csrf_token: Optional[str] = get_csrf_token()
-    # Fetch and parse data for each date
+    # Consolidate each day as soon as it is available so the parsed slot data can be dropped
+    desired_state: dict = {}
+    # Use cached data for dates fetched recently, and only fetch the rest
+    dates_to_fetch: List[str] = []
     for date_str in sync_dates:
-        logging.info(f"Fetching data for {date_str}...")
-        raw_data = fetch_hayward_data(date_str, args.throttle, csrf_token)
-        try:
-            daily_data = parse_reservation_data(raw_data, date_str)
-        except ValueError as ve:
-            logging.error(f"Error parsing data for {date_str}: {ve}")
-            sys.exit(1)
-        # Merge daily data into all_parsed_data
-        all_parsed_data.update(daily_data)
+        cached_data = load_cached_day(args.cache_dir, date_str, args.cache_ttl) if args.cache_dir else None
+        if cached_data is not None:
+            for day, locations in cached_data.items():
+                consolidate_day(day, locations, desired_state)
+        else:
+            dates_to_fetch.append(date_str)
+    if len(dates_to_fetch) < len(sync_dates):
+        logging.info("Using cached data for %s dates.", len(sync_dates) - len(dates_to_fetch))
     
-    # Get desired state from parsed reservation data by consolidating bookings
-    desired_state = consolidate_booked_slots(all_parsed_data)
+    failed_dates: set = set()
+    try:
+        if dates_to_fetch:
+            csrf_token: Optional[str] = get_csrf_token()
+            # Fetch data for the remaining dates concurrently, parsing each response as soon as it arrives
+            logging.info("Fetching data for %s dates with concurrency %s...", len(dates_to_fetch), args.concurrency)
+            for date_str, raw_data in fetch_all_hayward_data(dates_to_fetch, args.throttle, csrf_token, args.concurrency):
+                if raw_data is None:
+                    failed_dates.add(date_str)
+                    continue
+                try:
+                    daily_data = parse_reservation_data(raw_data, date_str, LOCATION_TO_CALENDAR)
+                except ValueError as ve:
+                    logging.error("Error parsing data for %s: %s", date_str, ve)
+                    failed_dates.add(date_str)
+                    continue
+                if args.cache_dir:
+                    store_cached_day(args.cache_dir, date_str, daily_data)
+                for day, locations in daily_data.items():
+                    consolidate_day(day, locations, desired_state)
+    finally:
+        # All Hayward requests are done; release the pooled connections
+        session.close()
+    if failed_dates:
+        logging.warning("Could not fetch or parse %s dates; leaving their calendar events untouched: %s", len(failed_dates), ", ".join(sorted(failed_dates)))
     
     # Calculate time boundaries for the sync window
     # Use first sync date with time "T00:00:00" and last sync date plus one day "T00:00:00"
     time_min = sync_dates[0] + "T00:00:00"
-    last_date = datetime.datetime.strptime(sync_dates[-1], "%Y-%m-%d").date()
-    next_day = last_date + datetime.timedelta(days=1)
-    time_max = next_day.strftime("%Y-%m-%d") + "T00:00:00"
+    last_date = datetime.date.fromisoformat(sync_dates[-1])
+    next_day_str: str = (last_date + datetime.timedelta(days=1)).isoformat()
+    time_max = next_day_str + "T00:00:00"
+    
+    state_db: Optional[sqlite3.Connection] = open_state_db(args.state_path) if args.state_path else None
+    listed_events: Dict[str, List[dict]] = {}
+    if state_db is None:
+        # List the calendars of all locations with booking data concurrently
+        calendar_ids = [calendar_id for location, calendar_id in LOCATION_TO_CALENDAR.items() if location in desired_state]
+        listed_events = fetch_events_by_calendar_id(credentials_path, calendar_ids, time_min, time_max)
     
     # Process each location based on the mapping
     for location, calendar_id in LOCATION_TO_CALENDAR.items():
-        logging.info(f"Processing location: {location}...")
+        logging.info("Processing location: %s...", location)
         if location not in desired_state:
-            logging.info(f"No booking data for {location}, skipping.")
+            logging.info("No booking data for %s, skipping.", location)
             continue
         
-        try:
-            existing_events = fetch_calendar_events(service, calendar_id, time_min, time_max)
-        except Exception as e:
-            logging.warning(f"Failed to fetch events for {location} (calendar {calendar_id}): {e}")
+        if state_db is not None:
+            try:
+                # Apply only the calendar changes since the last run to the local record
+                sync_state_events(service, state_db, calendar_id, args.full_sync)
+            except Exception as e:
+                logging.warning("Failed to fetch events for %s (calendar %s): %s", location, calendar_id, e)
+                continue
+            existing_events = load_state_events(state_db, calendar_id, sync_dates[0], next_day_str)
+        elif calendar_id in listed_events:
+            existing_events = listed_events[calendar_id]
+        else:
             continue
+        if failed_dates:
+            # Without booking data for a date, its existing events must not be treated as stale
+            existing_events = [event for event in existing_events if _event_local_date(event["start"]) not in failed_dates]
         
         events_to_create, events_to_delete = diff_events(desired_state[location], existing_events, location)
-        logging.info(f"{location}: {len(events_to_create)} events to create, {len(events_to_delete)} events to delete.")
+        logging.info("%s: %s events to create, %s events to delete.", location, len(events_to_create), len(events_to_delete))
         
-        for event in events_to_create:
-            create_google_event(service, calendar_id, event["summary"], event["start"], event["end"], TIMEZONE, args.dry_run)
-        for event_id in events_to_delete:
-            delete_google_event(service, calendar_id, event_id, args.dry_run)
+        created, deleted = apply_event_changes(service, calendar_id, events_to_create, events_to_delete, TIMEZONE, args.dry_run)
+        if state_db is not None:
+            for event, created_event in created:
+                record_state_event(state_db, calendar_id, created_event["id"], event["summary"], event["start"], event["end"])
+            for event_id in deleted:
+                forget_state_event(state_db, calendar_id, event_id)
+    
+    if state_db is not None:
+        state_db.close()
+    
+    if failed_dates:
+        # The other dates were synced, but the run is incomplete; exit non-zero so it gets noticed
+        logging.error("Sync incomplete: could not fetch or parse %s of %s dates.", len(failed_dates), len(sync_dates))
+        sys.exit(1)
     
     logging.info("Script execution completed.")
         
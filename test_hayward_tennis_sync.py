@@ -16,7 +16,7 @@ def test_get_sync_date_range():
     assert dates[0] == expected_first
     assert len(dates) == num_days
 
-# Test for fetch_hayward_data with monkeypatch for requests.get and time.sleep
+# Test for fetch_hayward_data with monkeypatch for session.post
 class FakeResponse:
     def __init__(self, content, status_code=200):
         self.content = content
@@ -32,13 +32,9 @@ def test_fetch_hayward_data(monkeypatch):
         assert "quickreservation/availability" in url, f"URL is {url}"
         return FakeResponse(fake_content)
     
-    def fake_sleep(seconds):
-        pass
-    
-    monkeypatch.setattr(time, "sleep", fake_sleep)
     monkeypatch.setattr(sync.session, "post", fake_post)
     
-    result = sync.fetch_hayward_data("2025-04-20", 1.5, None)
+    result = sync.fetch_hayward_data("2025-04-20", None)
     assert json.loads(result) == json.loads(fake_content)
 
 # Test parse_reservation_data with valid JSON
@@ -65,7 +61,24 @@ def test_parse_reservation_data_valid():
     assert "Mervin" in result["2025-04-20"]
     assert "Court 1" in result["2025-04-20"]["Mervin"]
     assert result["2025-04-20"]["Mervin"]["Court 1"]["09:00"] is True
-    assert result["2025-04-20"]["Mervin"]["Court 1"]["09:30"] is False
+    assert "09:30" not in result["2025-04-20"]["Mervin"]["Court 1"]
+
+# Test parse_reservation_data skips resources of locations that are not requested
+def test_parse_reservation_data_locations():
+    sample_json = {
+        "body": {
+            "availability": {
+                "time_slots": ["09:00-09:30"],
+                "resources": [
+                    {"resource_name": "Mervin - Tennis Court 1", "time_slot_details": [{"status": 1}]},
+                    {"resource_name": "Other Park - Tennis Court 1", "time_slot_details": [{"status": 1}]}
+                ]
+            }
+        }
+    }
+    json_data = json.dumps(sample_json).encode("utf-8")
+    result = sync.parse_reservation_data(json_data, "2025-04-20", {"Mervin", "Bay"})
+    assert list(result["2025-04-20"]) == ["Mervin"]
 
 # Test parse_reservation_data with invalid JSON should raise ValueError
 def test_parse_reservation_data_invalid():
@@ -103,15 +116,18 @@ def test_authenticate_google(monkeypatch):
             return http
     def fake_from_service_account_file(path, scopes):
         return DummyCredentials()
-    def fake_build(api, version, credentials):
+    def fake_build(api, version, credentials, static_discovery, cache_discovery):
         assert api == "calendar"
         assert version == "v3"
+        assert static_discovery is True
         return dummy_service
     import google.oauth2.service_account as service_account
     monkeypatch.setattr(service_account.Credentials, "from_service_account_file", fake_from_service_account_file)
     monkeypatch.setattr(sync, "build", fake_build)
+    sync._load_credentials.cache_clear()
     result = sync.authenticate_google("dummy_path.json")
     assert result is dummy_service
+    sync._load_credentials.cache_clear()
 
 # Test fetch_calendar_events by mocking service.events().list().execute()
 def test_fetch_calendar_events():
@@ -148,6 +164,12 @@ def test_diff_events():
     assert to_create == []
     assert to_delete == ["c"]
 
+# Test diff_events treats the same instant with a different UTC offset as equal
+def test_diff_events_offsets():
+    desired_slots = {"Court 1": [("2025-04-20T09:00:00-07:00", "2025-04-20T10:00:00-07:00")]}
+    existing_events = [{"id": "a", "summary": "Court 1", "start": "2025-04-20T16:00:00Z", "end": "2025-04-20T17:00:00+00:00"}]
+    assert sync.diff_events(desired_slots, existing_events, "Mervin") == ([], [])
+
 # Test create_google_event with dry-run and actual run
 def test_create_google_event(monkeypatch):
     dummy_service = MagicMock()
@@ -167,6 +189,8 @@ def test_create_google_event(monkeypatch):
                                       "2025-04-20T09:00:00Z", "2025-04-20T10:00:00Z",
                                       "America/Los_Angeles", False)
     assert result == dummy_event
+    body = dummy_events.insert.call_args.kwargs["body"]
+    assert body["extendedProperties"] == {"private": {"source": "hayward_sync"}}
 
 # Test delete_google_event with dry-run and actual run
 def test_delete_google_event(monkeypatch):
@@ -182,3 +206,202 @@ def test_delete_google_event(monkeypatch):
     dummy_service.events = MagicMock(return_value=dummy_events)
     sync.delete_google_event(dummy_service, "dummy_calendar", "event123", False)
     dummy_events.delete.assert_called_with(calendarId="dummy_calendar", eventId="event123")
+
+# Test fetch_all_hayward_data fetches every date and keys results by date
+def test_fetch_all_hayward_data(monkeypatch):
+    def fake_fetch(date_str, csrf_token):
+        return date_str.encode("utf-8")
+
+    monkeypatch.setattr(sync, "fetch_hayward_data", fake_fetch)
+    dates = ["2025-04-%02d" % day for day in range(1, 11)]
+    result = dict(sync.fetch_all_hayward_data(dates, 0, None, max_workers=2))
+    assert result == {d: d.encode("utf-8") for d in dates}
+
+# Test fetch_all_hayward_data reports a failed date without aborting the others
+def test_fetch_all_hayward_data_failure(monkeypatch):
+    def fake_fetch(date_str, csrf_token):
+        if date_str == "2025-04-02":
+            raise sync.requests.ConnectionError("connection reset")
+        return date_str.encode("utf-8")
+
+    monkeypatch.setattr(sync, "fetch_hayward_data", fake_fetch)
+    dates = ["2025-04-01", "2025-04-02", "2025-04-03"]
+    result = dict(sync.fetch_all_hayward_data(dates, 0, None, max_workers=2))
+    assert result == {"2025-04-01": b"2025-04-01", "2025-04-02": None, "2025-04-03": b"2025-04-03"}
+
+# Test _slot_iso_table on a regular day and on a DST transition day
+def test_slot_iso_table():
+    table = sync._slot_iso_table("2025-04-20")
+    assert len(table) == 49
+    assert table[18] == "2025-04-20T09:00:00-07:00"
+    assert table[-1] == "2025-04-21T00:00:00-07:00"
+    dst_table = sync._slot_iso_table("2025-11-02")
+    assert dst_table[0] == "2025-11-02T00:00:00-07:00"
+    assert dst_table[18] == "2025-11-02T09:00:00-08:00"
+
+# Test RateLimiter allows a burst and then spaces requests by the interval
+def test_rate_limiter(monkeypatch):
+    now = [100.0]
+    sleeps = []
+    def fake_sleep(seconds):
+        sleeps.append(seconds)
+        now[0] += seconds
+    monkeypatch.setattr(time, "monotonic", lambda: now[0])
+    monkeypatch.setattr(time, "sleep", fake_sleep)
+
+    limiter = sync.RateLimiter(2.0, burst=2)
+    limiter.acquire()
+    limiter.acquire()
+    assert sleeps == []
+    limiter.acquire()
+    assert sleeps == [2.0]
+    now[0] += 10
+    limiter.acquire()
+    assert sleeps == [2.0]
+
+# Test the local event state: full listing, incremental changes and recorded creates/deletes
+def test_state_db(tmp_path):
+    conn = sync.open_state_db(str(tmp_path / "state.sqlite"))
+    pages = [
+        {"items": [
+            {"id": "a", "summary": "Court 1", "start": {"dateTime": "2025-04-20T09:00:00-07:00"}, "end": {"dateTime": "2025-04-20T10:00:00-07:00"}},
+            {"id": "b", "summary": "Court 2", "start": {"dateTime": "2025-04-25T09:00:00-07:00"}, "end": {"dateTime": "2025-04-25T10:00:00-07:00"}},
+            {"id": "x", "summary": "Other Event", "start": {"dateTime": "2025-04-20T11:00:00-07:00"}, "end": {"dateTime": "2025-04-20T12:00:00-07:00"}}
+        ], "nextSyncToken": "token1"},
+        {"items": [
+            {"id": "a", "status": "cancelled"}
+        ], "nextSyncToken": "token2"}
+    ]
+    fake_events = MagicMock()
+    fake_events.list = MagicMock(side_effect=[MagicMock(execute=MagicMock(return_value=page)) for page in pages])
+    fake_service = MagicMock()
+    fake_service.events = MagicMock(return_value=fake_events)
+
+    sync.sync_state_events(fake_service, conn, "cal")
+    assert "syncToken" not in fake_events.list.call_args.kwargs
+    assert [e["id"] for e in sync.load_state_events(conn, "cal", "2025-04-20", "2025-04-30")] == ["a", "b"]
+
+    sync.sync_state_events(fake_service, conn, "cal")
+    assert fake_events.list.call_args.kwargs["syncToken"] == "token1"
+    assert [e["id"] for e in sync.load_state_events(conn, "cal", "2025-04-20", "2025-04-30")] == ["b"]
+
+    sync.record_state_event(conn, "cal", "c", "Court 3", "2025-04-21T09:00:00-07:00", "2025-04-21T10:00:00-07:00")
+    # Event IDs are only unique per calendar; the same ID in another calendar is a separate row
+    sync.record_state_event(conn, "other", "b", "Court 1", "2025-04-22T09:00:00-07:00", "2025-04-22T10:00:00-07:00")
+    sync.forget_state_event(conn, "cal", "b")
+    events = sync.load_state_events(conn, "cal", "2025-04-20", "2025-04-22")
+    assert [e["id"] for e in events] == ["c"]
+    assert [e["id"] for e in sync.load_state_events(conn, "other", "2025-04-20", "2025-04-30")] == ["b"]
+    conn.close()
+
+# Test open_state_db drops a state file keyed by event ID alone so the next run does a full sync
+def test_open_state_db_legacy(tmp_path):
+    path = str(tmp_path / "state.sqlite")
+    legacy = sync.sqlite3.connect(path)
+    legacy.execute("CREATE TABLE events (calendar_id TEXT NOT NULL, event_id TEXT PRIMARY KEY, summary TEXT NOT NULL, start TEXT NOT NULL, end TEXT NOT NULL)")
+    legacy.execute("CREATE TABLE sync_tokens (calendar_id TEXT PRIMARY KEY, sync_token TEXT NOT NULL)")
+    legacy.execute("INSERT INTO sync_tokens VALUES ('cal', 'token1')")
+    legacy.commit()
+    legacy.close()
+
+    conn = sync.open_state_db(path)
+    sync.record_state_event(conn, "cal", "a", "Court 1", "2025-04-20T09:00:00-07:00", "2025-04-20T10:00:00-07:00")
+    sync.record_state_event(conn, "other", "a", "Court 1", "2025-04-20T09:00:00-07:00", "2025-04-20T10:00:00-07:00")
+    assert conn.execute("SELECT COUNT(*) FROM events").fetchone()[0] == 2
+    assert conn.execute("SELECT COUNT(*) FROM sync_tokens").fetchone()[0] == 0
+    conn.close()
+
+# Test apply_event_changes sends inserts and deletes in batches of BATCH_SIZE
+def test_apply_event_changes(monkeypatch):
+    class FakeBatch:
+        def __init__(self, callback):
+            self.callback = callback
+            self.request_ids = []
+        def add(self, request, request_id):
+            self.request_ids.append(request_id)
+        def execute(self):
+            executed.append(len(self.request_ids))
+            for request_id in self.request_ids:
+                response = {"id": "new-" + request_id} if request_id.startswith("create") else None
+                self.callback(request_id, response, None)
+
+    executed = []
+    dummy_service = MagicMock()
+    dummy_service.new_batch_http_request = FakeBatch
+    monkeypatch.setattr(sync, "BATCH_SIZE", 2)
+    to_create = [
+        {"summary": "Court 1", "start": "2025-04-20T09:00:00-07:00", "end": "2025-04-20T10:00:00-07:00"},
+        {"summary": "Court 2", "start": "2025-04-20T10:00:00-07:00", "end": "2025-04-20T11:00:00-07:00"}
+    ]
+    created, deleted = sync.apply_event_changes(dummy_service, "dummy_calendar", to_create, ["a"], "America/Los_Angeles", False)
+    assert executed == [2, 1]
+    assert [(event["summary"], created_event["id"]) for event, created_event in created] == [("Court 1", "new-create-0"), ("Court 2", "new-create-1")]
+    assert deleted == ["a"]
+
+    # Dry-run: nothing is sent
+    executed.clear()
+    assert sync.apply_event_changes(dummy_service, "dummy_calendar", to_create, ["a"], "America/Los_Angeles", True) == ([], [])
+    assert executed == []
+
+# Test the per-date cache round-trip and expiry
+def test_cached_day(tmp_path):
+    cache_dir = str(tmp_path / "cache")
+    parsed = {"2025-04-20": {"Mervin": {"Court 1": {"09:00": True, "09:30": False}}}}
+    assert sync.load_cached_day(cache_dir, "2025-04-20", 60) is None
+    sync.store_cached_day(cache_dir, "2025-04-20", parsed)
+    assert sync.load_cached_day(cache_dir, "2025-04-20", 60) == parsed
+    assert sync.load_cached_day(cache_dir, "2025-04-20", -1) is None
+
+# Test store_cached_day ignores write failures and leaves no temporary file behind
+def test_store_cached_day_failure(tmp_path, monkeypatch):
+    def fake_replace(src, dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(sync.os, "replace", fake_replace)
+    sync.store_cached_day(str(tmp_path), "2025-04-20", {"2025-04-20": {}})
+    assert list(tmp_path.iterdir()) == []
+
+# Test fetch_events_by_calendar_id lists every calendar and leaves out failures
+def test_fetch_events_by_calendar_id(monkeypatch):
+    def fake_fetch(service, calendar_id, time_min_iso, time_max_iso):
+        if calendar_id == "broken":
+            raise Exception("boom")
+        return [{"id": calendar_id}]
+
+    monkeypatch.setattr(sync, "authenticate_google", lambda path: object())
+    monkeypatch.setattr(sync, "fetch_calendar_events", fake_fetch)
+    result = sync.fetch_events_by_calendar_id("dummy_path.json", ["cal1", "cal2", "broken"], "2025-04-20T00:00:00", "2025-04-21T00:00:00")
+    assert result == {"cal1": [{"id": "cal1"}], "cal2": [{"id": "cal2"}]}
+
+# Test main syncs the fetched dates, keeps events on failed dates, and exits non-zero
+def test_main_failed_dates(monkeypatch):
+    raw = json.dumps({"body": {"availability": {
+        "time_slots": ["09:00:00"],
+        "resources": [{"resource_name": "Mervin - Tennis Court 1", "time_slot_details": [{"status": 1}]}]
+    }}}).encode("utf-8")
+
+    def fake_fetch_all(dates, throttle_seconds, csrf_token, max_workers):
+        yield "2025-04-20", raw
+        yield "2025-04-21", None  # fetch failed
+        yield "2025-04-22", raw
+        yield "2025-04-23", b'{"unexpected": true}'  # parse failed
+
+    existing = [
+        # 17:00-19:00 PDT on the failed date 2025-04-21, returned in UTC
+        {"id": "kept", "summary": "Court 1", "start": "2025-04-22T00:00:00Z", "end": "2025-04-22T02:00:00Z"},
+        {"id": "stale", "summary": "Court 2", "start": "2025-04-20T10:00:00-07:00", "end": "2025-04-20T11:00:00-07:00"}
+    ]
+    applied = []
+    monkeypatch.setattr(sync.sys, "argv", ["hayward_tennis_sync.py", "--credentials-path", "dummy_path.json"])
+    monkeypatch.setattr(sync, "authenticate_google", lambda path: object())
+    monkeypatch.setattr(sync, "get_sync_date_range", lambda: ["2025-04-20", "2025-04-21", "2025-04-22", "2025-04-23"])
+    monkeypatch.setattr(sync, "get_csrf_token", lambda: "token")
+    monkeypatch.setattr(sync, "fetch_all_hayward_data", fake_fetch_all)
+    monkeypatch.setattr(sync, "fetch_events_by_calendar_id", lambda path, ids, tmin, tmax: {cid: list(existing) for cid in ids})
+    monkeypatch.setattr(sync, "apply_event_changes", lambda service, cid, create, delete, tz, dry_run: applied.append((create, delete)) or ([], []))
+    with pytest.raises(SystemExit) as exc_info:
+        sync.main()
+    assert exc_info.value.code == 1
+    to_create, to_delete = applied[0]
+    assert [event["start"][:10] for event in to_create] == ["2025-04-20", "2025-04-22"]
+    assert to_delete == ["stale"]